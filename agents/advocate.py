@@ -2,7 +2,7 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 import html
 
-def get_advocate_decision(trust: float, amount: float, llm):
+async def get_advocate_decision(trust: float, amount: float, llm):
     """
     User Advocate Agent Logic.
     Decides whether to fight for the user based on trust score.
@@ -32,13 +32,14 @@ def get_advocate_decision(trust: float, amount: float, llm):
     
     try:
         chain = prompt | llm | JsonOutputParser()
-        return chain.invoke({
+        return await chain.ainvoke({
             "trust": html.escape(str(trust)), 
             "amount": html.escape(str(amount))
         })
     except Exception as e:
         return {
             "thought": f"Error: {str(e)}",
+            "error": True,
             "vote": "WAIT",
             "stance": "System Error - I must wait."
         }
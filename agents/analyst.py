@@ -9,9 +9,7 @@ from langchain_core.messages import HumanMessage, SystemMessage
 
 from models.schemas import (
     TransactionSignal,
-    FactSheet,
-    BankStatus,
-    LedgerStatus
+    FactSheet
 )
 from core.prompts import SIGNAL_ANALYST_PROMPT, AGENT_NAMES
 
@@ -29,17 +27,17 @@ def determine_data_consistency(signal: TransactionSignal) -> str:
     ledger = signal.ledger_status
     
     # Indeterminate cases - cannot know the truth
-    if bank in [BankStatus.TIMEOUT_504, BankStatus.PENDING]:
+    if bank in ("TIMEOUT_504", "PENDING"):
         return "INDETERMINATE"
     
-    if ledger == LedgerStatus.PENDING:
+    if ledger == "PENDING":
         return "INDETERMINATE"
     
     # Consistent cases
-    if bank == BankStatus.FAILED and ledger == LedgerStatus.NOT_FOUND:
+    if bank == "FAILED" and ledger == "NOT_FOUND":
         return "CONSISTENT"
     
-    if bank == BankStatus.SUCCESS and ledger == LedgerStatus.FOUND:
+    if bank == "SUCCESS" and ledger == "FOUND":
         return "CONSISTENT"
     
     # Conflicting cases
@@ -52,19 +50,20 @@ def create_fact_sheet(signal: TransactionSignal) -> FactSheet:
     This is the deterministic, non-LLM path for fact extraction.
     """
     bank_response_map = {
-        BankStatus.SUCCESS: "Bank API confirmed transaction SUCCESS",
-        BankStatus.FAILED: "Bank API confirmed transaction FAILED",
-        BankStatus.TIMEOUT_504: "Bank API returned 504 GATEWAY TIMEOUT - state UNKNOWN",
-        BankStatus.PENDING: "Bank API returned PENDING - transaction in progress"
+        "SUCCESS": "Bank API confirmed transaction SUCCESS",
+        "FAILED": "Bank API confirmed transaction FAILED",
+        "TIMEOUT_504": "Bank API returned 504 GATEWAY TIMEOUT - state UNKNOWN",
+        "PENDING": "Bank API returned PENDING - transaction in progress"
     }
     
     consistency = determine_data_consistency(signal)
     
-    return FactSheet(
+    # signal is already validated - skip re-validating the FactSheet built from it
+    return FactSheet.trusted(
         transaction_id=signal.transaction_id,
         bank_api_response=bank_response_map.get(signal.bank_status, "Unknown bank response"),
-        ledger_entry_exists=signal.ledger_status == LedgerStatus.FOUND,
-        ledger_state=signal.ledger_status.value,
+        ledger_entry_exists=signal.ledger_status == "FOUND",
+        ledger_state=signal.ledger_status,
         data_consistency=consistency,
         raw_signals=signal
     )
@@ -96,8 +95,8 @@ Analyze this transaction signal and confirm the FactSheet:
 
 Transaction ID: {signal.transaction_id}
 User Claim: {signal.user_claim}
-Bank Status: {signal.bank_status.value}
-Ledger Status: {signal.ledger_status.value}
+Bank Status: {signal.bank_status}
+Ledger Status: {signal.ledger_status}
 Amount: ${signal.amount}
 
 Generated FactSheet:
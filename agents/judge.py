@@ -2,7 +2,7 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 import html
 
-def get_judge_decision(adv_vote: str, risk_vote: str, llm):
+async def get_judge_decision(adv_vote: str, risk_vote: str, llm):
     """
     Judge Logic.
     Decides final verdict based on agent arguments.
@@ -32,13 +32,14 @@ def get_judge_decision(adv_vote: str, risk_vote: str, llm):
     
     try:
         chain = prompt | llm | JsonOutputParser()
-        return chain.invoke({
+        return await chain.ainvoke({
             "adv": html.escape(str(adv_vote)), 
             "risk": html.escape(str(risk_vote))
         })
     except Exception as e:
         return {
             "thought": f"Error: {str(e)}",
+            "error": True,
             "verdict": "ESCALATE",
             "reason": "Judicial Error - Circuit Breaker Activated",
             "circuit_breaker": True
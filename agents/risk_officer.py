@@ -2,7 +2,7 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 import html
 
-def get_risk_decision(status: str, llm):
+async def get_risk_decision(status: str, llm):
     """
     Risk Officer Logic.
     Decides whether to block based on network status.
@@ -32,10 +32,11 @@ def get_risk_decision(status: str, llm):
     
     try:
         chain = prompt | llm | JsonOutputParser()
-        return chain.invoke({"status": html.escape(str(status))})
+        return await chain.ainvoke({"status": html.escape(str(status))})
     except Exception as e:
         return {
             "thought": f"Error: {str(e)}",
+            "error": True,
             "vote": "OBJECTION",
             "score": 100,
             "stance": "System Error - Blocking for safety."
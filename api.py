@@ -3,7 +3,7 @@ Sentinel: FastAPI Middleware
 ============================
 
 Exposes TribunalBrain via REST API.
-Saves full logs to transactions_db.json.
+Appends full logs to transactions_db.jsonl (one JSON object per line).
 
 HOW TO RUN THE COMPLETE SYSTEM:
 ================================
@@ -17,13 +17,14 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime
-import json
+import orjson
 import os
 import uuid
 import threading
+from collections import Counter
 from contextlib import contextmanager
 
-from core_logic import TribunalBrain
+from core_logic import TribunalBrain, http_client
 
 # File Lock for Thread Safety
 DB_LOCK = threading.Lock()
@@ -46,7 +47,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-DB_FILE = "transactions_db.json"
+DB_FILE = "transactions_db.jsonl"
+
+# Log Rotation: keep the last MAX_RECORDS transactions, but only rewrite
+# the file once it reaches COMPACT_AT lines so appends stay O(1)
+MAX_RECORDS = 1000
+COMPACT_AT = 2 * MAX_RECORDS
+_db_lines: Optional[int] = None
 
 
 # ============================================================================
@@ -77,50 +84,68 @@ class WebhookPayload(BaseModel):
 # DATABASE
 # ============================================================================
 
+def parse_records(data: bytes) -> list:
+    """Decode NDJSON bytes (one transaction per line), skipping corrupted lines."""
+    records = []
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        try:
+            records.append(orjson.loads(line))
+        except orjson.JSONDecodeError:
+            print(f"Error: skipping corrupted line in {DB_FILE}.")
+    return records
+
+
 def load_db() -> list:
     if not os.path.exists(DB_FILE):
         return []
     try:
         with DB_LOCK:
-            with open(DB_FILE, "r") as f:
-                content = f.read().strip()
-                if not content:
-                    return []
-                return json.loads(content)
-    except json.JSONDecodeError:
-        print(f"Error: {DB_FILE} is corrupted. Returning empty list.")
-        return []
+            with open(DB_FILE, "rb") as f:
+                content = f.read()
+        return parse_records(content)[-MAX_RECORDS:]
     except Exception as e:
         print(f"Error loading DB: {e}")
         return []
 
 
 def save_db(transactions: list):
-    with open(DB_FILE, "w") as f:
-        json.dump(transactions, f, indent=2)
+    """Atomically replace the DB with `transactions` (readers never see a partial file)."""
+    tmp_file = f"{DB_FILE}.tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(b"".join(orjson.dumps(t) + b"\n" for t in transactions))
+    os.replace(tmp_file, DB_FILE)
 
 
 def append_transaction(record: dict):
+    global _db_lines
     with DB_LOCK:
-        # Load inside the lock to prevent lost updates
-        if os.path.exists(DB_FILE):
-            try:
-                with open(DB_FILE, "r") as f:
-                    content = f.read().strip()
-                    transactions = json.loads(content) if content else []
-            except (json.JSONDecodeError, FileNotFoundError):
-                transactions = []
-        else:
-            transactions = []
+        # Count existing lines once per process (or after the file was cleared)
+        if _db_lines is None or not os.path.exists(DB_FILE):
+            _db_lines = 0
+            if os.path.exists(DB_FILE):
+                with open(DB_FILE, "rb") as f:
+                    _db_lines = f.read().count(b"\n")
         
-        transactions.append(record)
+        # Append-only: one line per transaction, no rewrite of existing data
+        with open(DB_FILE, "ab+") as f:
+            line = orjson.dumps(record) + b"\n"
+            # A torn last write (crash mid-line) must not swallow this record into it
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    line = b"\n" + line
+                    _db_lines += 1
+            f.write(line)
+        _db_lines += 1
         
-        # Log Rotation: Keep last 1000 records to prevent disk overflow
-        if len(transactions) > 1000:
-            transactions = transactions[-1000:]
-        
-        with open(DB_FILE, "w") as f:
-            json.dump(transactions, f, indent=2)
+        # Log Rotation: once the file doubles, compact it to the last MAX_RECORDS
+        if _db_lines > COMPACT_AT:
+            with open(DB_FILE, "rb") as f:
+                transactions = parse_records(f.read())[-MAX_RECORDS:]
+            save_db(transactions)
+            _db_lines = len(transactions)
 
 
 # ============================================================================
@@ -138,6 +163,11 @@ async def startup_event():
         print("\n\n🚨🚨🚨 CRITICAL ERROR: OPENAI_API_KEY is missing! 🚨🚨🚨\n")
         # We warn loudly but don't exit to allow hot-reloading fixes
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close the pooled LLM HTTP connections."""
+    await http_client.aclose()
+
 @app.get("/")
 async def root():
     return {
@@ -177,7 +207,7 @@ async def process_webhook(payload: WebhookPayload):
         }
 
     # Run through TribunalBrain (with deep logging)
-    result = TribunalBrain.analyze(
+    result = await TribunalBrain.analyze(
         transaction_id=tx_id,
         amount=payload.amount,
         user_trust=payload.user_trust,
@@ -238,22 +268,15 @@ async def get_stats():
     """Get statistics."""
     transactions = load_db()
     
-    total = len(transactions)
-    approved = sum(1 for t in transactions if t.get("verdict") == "APPROVE")
-    denied = sum(1 for t in transactions if t.get("verdict") == "DENY")
-    escalated = sum(1 for t in transactions if t.get("verdict") == "ESCALATE")
-    
-    money_saved = sum(
-        t.get("amount", 0) 
-        for t in transactions 
-        if t.get("circuit_breaker", False)
-    )
+    # One pass for the verdict counts, one for the circuit-breaker amounts
+    verdicts = Counter(t.get("verdict") for t in transactions)
+    money_saved = sum(t.get("amount", 0) for t in transactions if t.get("circuit_breaker", False))
     
     return {
-        "total": total,
-        "approved": approved,
-        "denied": denied,
-        "escalated": escalated,
+        "total": len(transactions),
+        "approved": verdicts["APPROVE"],
+        "denied": verdicts["DENY"],
+        "escalated": verdicts["ESCALATE"],
         "money_saved": money_saved
     }
 
@@ -16,6 +16,7 @@ from datetime import datetime
 
 # Import the shared brain
 from core_logic import TribunalBrain
+from models import ADVOCATE, RISK_OFFICER
 
 # ============================================================================
 # PAGE CONFIGURATION
@@ -106,6 +107,13 @@ CHAOS_MODES = {
 
 TRAP_MODES = ["⚠️ 504 GATEWAY TIMEOUT (Ambiguity Trap)", "🕵️ 404 NOT FOUND (Friendly Fraud)"]
 
+# Speaker -> (chat avatar, history callout); anyone else is the Judge
+AGENT_META = {
+    ADVOCATE: ("🧑‍💼", st.info),
+    RISK_OFFICER: ("👮", st.warning)
+}
+JUDGE_META = ("⚖️", st.success)
+
 
 # ============================================================================
 # MAIN UI
@@ -199,21 +207,25 @@ with col2:
         # Phase 2: Run through TribunalBrain (THE SHARED LOGIC)
         st.markdown("#### Phase 2: Agent Debate")
         
-        result = TribunalBrain.assess_transaction(
+        tx_id = f"TX-{random.randint(10000, 99999)}"
+        result = TribunalBrain.analyze_blocking(
+            transaction_id=tx_id,
             amount=amount,
             user_trust=trust_score,
-            network_status=network_status
+            network_status=network_status,
+            allow_fast_path=False  # the sandbox is here to show the debate
         )
         
+        # Public statements only - internal THOUGHT logs stay on the dashboard
+        debate = [
+            {"agent": log["agent"], "message": log["message"]}
+            for log in result["logs"]
+            if log["type"] in ("SPEAK", "VERDICT")
+        ]
+        
         # Display agent debate
-        for entry in result["debate"]:
-            if entry["agent"] == "Advocate":
-                avatar = "🧑‍💼"
-            elif entry["agent"] == "Risk Officer":
-                avatar = "👮"
-            else:
-                avatar = "⚖️"
-            
+        for entry in debate:
+            avatar, _ = AGENT_META.get(entry["agent"], JUDGE_META)
             with st.chat_message(entry["agent"], avatar=avatar):
                 st.markdown(entry["message"])
             time.sleep(1)
@@ -221,9 +233,9 @@ with col2:
         # Phase 3: Verdict
         st.markdown("#### Phase 3: Final Verdict")
         
-        if result["decision"] == "APPROVE":
+        if result["verdict"] == "APPROVE":
             st.markdown('<div class="verdict-approve">✅ APPROVED</div>', unsafe_allow_html=True)
-        elif result["decision"] == "DENY":
+        elif result["verdict"] == "DENY":
             st.markdown('<div class="verdict-deny">🚫 DENIED</div>', unsafe_allow_html=True)
         else:
             st.markdown('<div class="verdict-escalate">🔒 ESCALATED - CIRCUIT BREAKER TRIGGERED</div>', unsafe_allow_html=True)
@@ -233,7 +245,7 @@ with col2:
         # Add to transaction history
         st.session_state.transaction_history.append({
             "timestamp": datetime.now().strftime("%H:%M:%S"),
-            "tx_id": f"TX-{random.randint(10000, 99999)}",
+            "tx_id": tx_id,
             "user_id": user_id,
             "amount": amount,
             "amount_display": f"${amount:,.0f}",
@@ -241,10 +253,10 @@ with col2:
             "network_status": network_status,
             "trust": trust_score,
             "trust_display": f"{trust_score:.0%}",
-            "decision": result["decision"],
+            "decision": result["verdict"],
             "circuit_breaker": result["circuit_breaker"],
             "risk_score": result["risk_score"],
-            "debate_log": result["debate"]
+            "debate_log": debate
         })
     
     else:
@@ -307,12 +319,8 @@ if st.session_state.transaction_history:
             st.markdown("---")
             st.markdown("**🗣️ Agent Communications:**")
             for entry in tx["debate_log"]:
-                if entry["agent"] == "Advocate":
-                    st.info(entry["message"])
-                elif entry["agent"] == "Risk Officer":
-                    st.warning(entry["message"])
-                else:
-                    st.success(entry["message"])
+                _, callout = AGENT_META.get(entry["agent"], JUDGE_META)
+                callout(entry["message"])
     
     # Clear history
     if st.button("🗑️ Clear History"):
@@ -19,6 +19,8 @@ from enum import Enum
 import operator
 import os
 import json
+import asyncio
+import httpx
 from dotenv import load_dotenv
 
 from langchain_openai import ChatOpenAI
@@ -28,16 +30,26 @@ from langgraph.graph import StateGraph, END
 from agents.advocate import get_advocate_decision
 from agents.risk_officer import get_risk_decision
 from agents.judge import get_judge_decision
+from models import ADVOCATE, RISK_OFFICER, JUDGE
+from loop_bridge import run_blocking
 
 # Load environment variables
 load_dotenv()
 
+# Shared HTTP client - keeps TLS connections to OpenAI alive across all agent calls
+http_client = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+    timeout=20
+)
+
 # Initialize LLM with Timeout
 try:
     llm = ChatOpenAI(
         model="gpt-4o", 
         temperature=0.2,
-        request_timeout=20  # Hard timeout to prevent silent hanging
+        request_timeout=20,  # Hard timeout to prevent silent hanging
+        http_async_client=http_client
     )
 except Exception as e:
     print(f"CRITICAL WARNING: LLM not initialized: {e}")
@@ -95,6 +107,9 @@ class TribunalState(TypedDict):
     reason: Optional[str]
     circuit_breaker: Optional[bool]
     
+    # Set if any agent fell back to its safe default (LLM error/timeout)
+    agent_error: Annotated[bool, operator.or_]
+    
     # Shared Logs (Append-only)
     logs: Annotated[List[dict], merge_logs]
 
@@ -103,65 +118,132 @@ class TribunalState(TypedDict):
 # AGENT NODES
 # ============================================================================
 
-def advocate_node(state: TribunalState):
+async def advocate_node(state: TribunalState):
     """The Customer Advocate Agent."""
     trust = state["user_trust"]
     amount = state["amount"]
     
-    result = get_advocate_decision(trust, amount, llm)
+    result = await get_advocate_decision(trust, amount, llm)
     
     # Create logs
     new_logs = [
-        LogEntry("THOUGHT", "Advocate", result.get("thought", "")).to_dict(),
-        LogEntry("SPEAK", "Advocate", result.get("stance", "")).to_dict()
+        LogEntry("THOUGHT", ADVOCATE, result.get("thought", "")).to_dict(),
+        LogEntry("SPEAK", ADVOCATE, result.get("stance", "")).to_dict()
     ]
     
     return {
         "advocate_vote": result.get("vote", "WAIT"),
         "advocate_stance": result.get("stance", ""),
+        "agent_error": result.get("error", False),
         "logs": new_logs
     }
 
 
-def risk_node(state: TribunalState):
+async def risk_node(state: TribunalState):
     """The Risk Officer Agent."""
     status = state["network_status"]
     
-    result = get_risk_decision(status, llm)
+    result = await get_risk_decision(status, llm)
     
     new_logs = [
-        LogEntry("THOUGHT", "Risk Officer", result.get("thought", "")).to_dict(),
-        LogEntry("SPEAK", "Risk Officer", result.get("stance", "")).to_dict()
+        LogEntry("THOUGHT", RISK_OFFICER, result.get("thought", "")).to_dict(),
+        LogEntry("SPEAK", RISK_OFFICER, result.get("stance", "")).to_dict()
     ]
     
     return {
         "risk_vote": result.get("vote", "OBJECTION"),
         "risk_score": result.get("score", 100),
         "risk_stance": result.get("stance", ""),
+        "agent_error": result.get("error", False),
         "logs": new_logs
     }
 
 
-def judge_node(state: TribunalState):
+async def judge_node(state: TribunalState):
     """The Judge Agent."""
     adv_vote = state["advocate_vote"]
     risk_vote = state["risk_vote"]
     
-    result = get_judge_decision(adv_vote, risk_vote, llm)
+    result = await get_judge_decision(adv_vote, risk_vote, llm)
     
     new_logs = [
-        LogEntry("JUDGE", "Judge", result.get("thought", "")).to_dict(),
-        LogEntry("VERDICT", "Judge", f"{result.get('verdict', 'ESCALATE')} - {result.get('reason', '')}").to_dict()
+        LogEntry("JUDGE", JUDGE, result.get("thought", "")).to_dict(),
+        LogEntry("VERDICT", JUDGE, f"{result.get('verdict', 'ESCALATE')} - {result.get('reason', '')}").to_dict()
     ]
     
     return {
         "verdict": result.get("verdict", "ESCALATE"),
         "reason": result.get("reason", "Graph Error"),
         "circuit_breaker": result.get("circuit_breaker", True),
+        "agent_error": result.get("error", False),
         "logs": new_logs
     }
 
 
+# ============================================================================
+# GRAPH (compiled once per process)
+# ============================================================================
+
+def build_tribunal_graph():
+    """Wire Advocate -> Risk Officer -> Judge and compile the graph."""
+    workflow = StateGraph(TribunalState)
+    
+    workflow.add_node("advocate", advocate_node)
+    workflow.add_node("risk", risk_node)
+    workflow.add_node("judge", judge_node)
+    
+    workflow.set_entry_point("advocate")
+    workflow.add_edge("advocate", "risk")
+    workflow.add_edge("risk", "judge")
+    workflow.add_edge("judge", END)
+    
+    return workflow.compile()
+
+
+tribunal_graph = build_tribunal_graph()
+
+
+# ============================================================================
+# FAST PATH (unambiguous cases skip the debate)
+# ============================================================================
+
+def fast_path_enabled_from_env() -> bool:
+    """SENTINEL_FAST_PATH=0 always runs the full debate (e.g. to show the agents' reasoning)."""
+    return os.getenv("SENTINEL_FAST_PATH", "1") != "0"
+
+
+FAST_PATH_ENABLED = fast_path_enabled_from_env()
+
+# A 504 always draws the Risk Officer's veto, whoever the customer is
+TIMEOUT_FAST_PATH = ("ESCALATE", 100, "Fast path: 504 timeout - funds in limbo, Risk Officer veto is mandatory")
+
+# (network_status, trust bucket) -> (verdict, risk_score, reason)
+# Only cases where the agent protocols leave no choice: a clean 200 for a VIP (the Advocate's
+# trust >= 0.8) is consensual, a declined 402 for a flagged user is a denial.
+FAST_PATHS = {
+    ("SUCCESS_200", "high"): ("APPROVE", 0, "Fast path: bank confirmed payment for a VIP customer"),
+    ("FAILED_402", "low"): ("DENY", 100, "Fast path: bank declined payment for a low-trust customer"),
+}
+
+
+def trust_bucket(user_trust: float) -> str:
+    """Coarse trust level used as the fast-path key ("high" matches the Advocate's VIP line)."""
+    if user_trust >= 0.8:
+        return "high"
+    if user_trust <= 0.3:
+        return "low"
+    return "mid"
+
+
+def fast_path(user_trust: float, network_status: str) -> Optional[tuple]:
+    """(verdict, risk_score, reason) if this case needs no debate, else None."""
+    if not FAST_PATH_ENABLED:
+        return None
+    if network_status == "TIMEOUT_504":
+        return TIMEOUT_FAST_PATH
+    return FAST_PATHS.get((network_status, trust_bucket(user_trust)))
+
+
 # ============================================================================
 # TRIBUNAL BRAIN (GRAPH RUNNER)
 # ============================================================================
@@ -170,30 +252,38 @@ class TribunalBrain:
     """Wrapper to run the LangGraph Tribunal."""
     
     @classmethod
-    def analyze(cls, transaction_id: str, amount: float, user_trust: float, network_status: str) -> dict:
-        """Run the graph."""
-        
-        # 1. Setup Graph
-        workflow = StateGraph(TribunalState)
-        
-        workflow.add_node("advocate", advocate_node)
-        workflow.add_node("risk", risk_node)
-        workflow.add_node("judge", judge_node)
-        
-        workflow.set_entry_point("advocate")
-        workflow.add_edge("advocate", "risk")
-        workflow.add_edge("risk", "judge")
-        workflow.add_edge("judge", END)
+    async def analyze(cls, transaction_id: str, amount: float, user_trust: float, network_status: str,
+                      allow_fast_path: bool = True) -> dict:
+        """
+        Run the graph (async - the agent LLM calls are awaited, not blocking).
+        allow_fast_path=False always runs the debate, e.g. for demos that show the agents' reasoning.
+        """
         
-        app = workflow.compile()
-        
-        # 2. Initial Logs
+        # 1. Initial Logs
         init_logs = [
             LogEntry("SYSTEM", "Tribunal", f"Tribunal activated for Tx {transaction_id}").to_dict(),
             LogEntry("SYSTEM", "Tribunal", f"Loading Profile: Trust {user_trust:.0%}").to_dict(),
             LogEntry("SYSTEM", "Tribunal", f"Network Signal: {network_status}").to_dict()
         ]
         
+        # 2. Fast path - no LLM calls for cases the protocols already decide
+        shortcut = fast_path(user_trust, network_status) if allow_fast_path else None
+        if shortcut:
+            verdict, risk_score, reason = shortcut
+            return {
+                "verdict": verdict,
+                "reason": reason,
+                "risk_score": risk_score,
+                "circuit_breaker": verdict == "ESCALATE",
+                "logs": init_logs + [
+                    LogEntry("SYSTEM", "Tribunal", "Unambiguous signal - debate skipped").to_dict(),
+                    LogEntry("VERDICT", JUDGE, f"{verdict} - {reason}").to_dict()
+                ],
+                "advocate_vote": "SKIPPED",
+                "risk_vote": "SKIPPED",
+                "agent_error": False
+            }
+        
         # 3. Invoke
         inputs = {
             "transaction_id": transaction_id,
@@ -203,7 +293,7 @@ class TribunalBrain:
             "logs": init_logs
         }
         
-        final_state = app.invoke(inputs)
+        final_state = await tribunal_graph.ainvoke(inputs)
         
         # 4. Format Output
         return {
@@ -213,14 +303,21 @@ class TribunalBrain:
             "circuit_breaker": final_state.get("circuit_breaker", True),
             "logs": final_state.get("logs", []),
             "advocate_vote": final_state.get("advocate_vote", "WAIT"),
-            "risk_vote": final_state.get("risk_vote", "OBJECTION")
+            "risk_vote": final_state.get("risk_vote", "OBJECTION"),
+            "agent_error": final_state.get("agent_error", False)
         }
+    
+    @classmethod
+    def analyze_blocking(cls, transaction_id: str, amount: float, user_trust: float, network_status: str,
+                         allow_fast_path: bool = True) -> dict:
+        """Run analyze() on the shared background loop and wait for the verdict."""
+        return run_blocking(cls.analyze(transaction_id, amount, user_trust, network_status, allow_fast_path))
 
 
 # Quick test
 if __name__ == "__main__":
     print("=== Testing LangGraph Tribunal ===\n")
-    res = TribunalBrain.analyze("TEST-LG", 5000, 0.9, "TIMEOUT_504")
+    res = asyncio.run(TribunalBrain.analyze("TEST-LG", 5000, 0.9, "TIMEOUT_504"))
     print(f"Verdict: {res['verdict']}")
     print(f"Reason: {res['reason']}")
     print("-" * 20)
@@ -15,13 +15,16 @@ Terminal 3: streamlit run merchant_store.py --server.port 8502
 
 import streamlit as st
 import pandas as pd
-import json
+import pyarrow as pa
+import orjson
+import mmap
 import os
-import time
 import random
 from datetime import datetime
+from itertools import islice
 
 from core_logic import TribunalBrain
+from models import ADVOCATE, RISK_OFFICER, JUDGE
 
 # ============================================================================
 # PAGE CONFIG
@@ -59,6 +62,16 @@ st.markdown("""
         50% { opacity: 0.7; }
     }
     
+    /* Staggered client-side reveal of debate lines (no server-side sleeps) */
+    .fade-in {
+        opacity: 0;
+        animation: fade-in 0.4s ease-out forwards;
+    }
+    @keyframes fade-in {
+        from { opacity: 0; transform: translateY(4px); }
+        to { opacity: 1; transform: none; }
+    }
+    
     .thought-box {
         background: #1e1e3f;
         border-left: 4px solid #6c757d;
@@ -68,6 +81,13 @@ st.markdown("""
         font-style: italic;
         color: #aaa;
     }
+    .speak-box {
+        background: #16213e;
+        border-left: 4px solid #ffc107;
+        padding: 2px 15px;
+        margin: 5px 0;
+        border-radius: 0 8px 8px 0;
+    }
     .system-box {
         background: #0d1117;
         border-left: 4px solid #58a6ff;
@@ -79,7 +99,192 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-DB_FILE = "transactions_db.json"
+DB_FILE = "transactions_db.jsonl"
+
+# Matches the API's log rotation
+MAX_RECORDS = 1000
+INSPECTOR_RECENT = 200  # ids offered in the Inspector dropdown; older ones via search
+
+
+# ============================================================================
+# HELPER: Simulation Gym
+# ============================================================================
+
+# Stands in for the transaction id inside cached runs; swapped for the caller's id on replay
+CACHED_TX_ID = "{tx_id}"
+
+
+class UncacheableRun(Exception):
+    """Raised inside the cached run so st.cache_data does not store an agent-error fallback."""
+    
+    def __init__(self, result: dict):
+        super().__init__("agent fell back to its safe default")
+        self.result = result
+
+
+@st.cache_data(ttl=600, max_entries=256, show_spinner=False)
+def _analyze_memo(amount: float, trust: float, status: str) -> dict:
+    # The Gym exists to show the debate, so it never takes the fast path
+    result = TribunalBrain.analyze_blocking(CACHED_TX_ID, amount, trust, status, allow_fast_path=False)
+    if result.get("agent_error"):
+        raise UncacheableRun(result)
+    return result
+
+
+def analyze_cached(amount: float, trust: float, status: str, tx_id: str) -> dict:
+    """
+    Memoized tribunal run, keyed on (amount, trust, status) for up to 10 minutes.
+    Repeating a run replays the first verdict (and its logs) for those inputs, relabelled
+    with this run's tx_id. Runs where an agent errored (LLM timeout, rate limit) are never stored.
+    """
+    try:
+        result = _analyze_memo(amount, trust, status)
+    except UncacheableRun as e:
+        result = e.result
+    # st.cache_data hands back a copy, so relabelling it leaves the cache untouched
+    for log in result["logs"]:
+        log["message"] = log["message"].replace(CACHED_TX_ID, tx_id)
+    return result
+
+
+# ============================================================================
+# HELPER: Database (incremental NDJSON tail)
+# ============================================================================
+
+def tail_transactions(path: str = DB_FILE) -> list:
+    """
+    Return this session's transactions, parsing only lines appended since the last rerun.
+    The byte offset and parsed records live in session_state; a cleared or rotated
+    file (missing, new inode, or shorter than the offset) is re-read from the start.
+    """
+    state = st.session_state
+    stat = os.stat(path) if os.path.exists(path) else None
+    
+    if stat is None or stat.st_ino != state.get("db_inode") or stat.st_size < state.get("db_offset", 0):
+        state.db_inode = stat.st_ino if stat else None
+        state.db_offset = 0
+        state.txs = []
+        state.db_views = None
+        state.db_feed = None
+    
+    if stat is None or stat.st_size == state.db_offset:
+        return state.txs
+    
+    # Map the file instead of reading it into a buffer - lines come straight from the page cache
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # Only consume complete lines - the API may be mid-append
+        end = mm.rfind(b"\n", state.db_offset) + 1
+        if end <= state.db_offset:
+            return state.txs
+        mm.seek(state.db_offset)
+        while mm.tell() < end:
+            line = mm.readline()
+            if line.strip():
+                try:
+                    state.txs.append(orjson.loads(line))
+                except orjson.JSONDecodeError:
+                    pass
+    del state.txs[:-MAX_RECORDS]
+    state.db_offset = end
+    state.db_views = None
+    state.db_feed = None
+    return state.txs
+
+
+def db_views() -> tuple:
+    """
+    (frame, tx_index, tx_ids) for this session's transactions, rebuilt only
+    after tail_transactions() picked up new rows.
+    - frame: metric/feed columns only, nested debate logs skipped
+    - frame verdicts are categorical (int codes, not per-row string compares)
+    - tx_index: transaction_id -> record, for O(1) Inspector lookups
+    - tx_ids: the INSPECTOR_RECENT newest transaction ids, newest first
+    """
+    state = st.session_state
+    if state.db_views is None:
+        frame = pd.DataFrame(state.txs, columns=[*FEED_COLUMNS, "circuit_breaker"])
+        frame["verdict"] = as_verdict_category(frame["verdict"])
+        tx_index = {t.get("transaction_id"): t for t in state.txs}
+        state.db_views = (frame, tx_index, list(islice(reversed(tx_index), INSPECTOR_RECENT)))
+    return state.db_views
+
+
+# DB field -> Recent Transactions column
+FEED_COLUMNS = {
+    "timestamp": "Time",
+    "transaction_id": "TX ID",
+    "user_id": "User",
+    "amount": "Amount",
+    "user_trust": "Trust",
+    "network_status": "Network",
+    "advocate_vote": "Advocate",
+    "risk_vote": "Risk",
+    "verdict": "Verdict"
+}
+
+# Colour-coded verdict labels (replaces per-row Styler highlighting)
+VERDICT_BADGES = {
+    "APPROVE": "🟢 APPROVE",
+    "DENY": "🔴 DENY",
+    "ESCALATE": "🟡 ESCALATE"
+}
+
+
+def as_verdict_category(verdicts: pd.Series) -> pd.Series:
+    """Encode verdicts as a Categorical; unexpected values become extra categories."""
+    categories = list(dict.fromkeys([*VERDICT_BADGES, *verdicts.dropna().unique()]))
+    return verdicts.astype(pd.CategoricalDtype(categories))
+
+
+def compute_metrics(frame: pd.DataFrame) -> dict:
+    """Verdict counts and money saved in one vectorized pass over the frame."""
+    counts = frame["verdict"].value_counts()
+    return {
+        "total": len(frame),
+        "approved": int(counts.get("APPROVE", 0)),
+        "denied": int(counts.get("DENY", 0)),
+        "escalated": int(counts.get("ESCALATE", 0)),
+        "money_saved": float(frame.loc[frame["circuit_breaker"].eq(True), "amount"].sum())
+    }
+
+
+def build_display_df(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Recent Transactions table (newest first) built from the frame columns.
+    Amount and Trust stay numeric - the frontend formats them via FEED_COLUMN_CONFIG.
+    """
+    df = frame.iloc[::-1][list(FEED_COLUMNS)].rename(columns=FEED_COLUMNS)
+    df["Time"] = df["Time"].fillna("").str.slice(0, 19)
+    df["Amount"] = df["Amount"].fillna(0).astype(float)
+    df["Trust"] = df["Trust"].fillna(0).astype(float) * 100
+    # Relabel the categories, not the rows; "" must be a category so fillna works
+    # (it already is when the Judge wrote an empty verdict)
+    verdicts = df["Verdict"].cat.rename_categories(VERDICT_BADGES)
+    if "" not in verdicts.cat.categories:
+        verdicts = verdicts.cat.add_categories("")
+    df["Verdict"] = verdicts
+    return df.fillna("").reset_index(drop=True)
+
+
+def feed_table() -> pa.Table:
+    """
+    Recent Transactions as an Arrow table, converted once per batch of new rows.
+    Streamlit ships Arrow tables as-is instead of re-converting a DataFrame every rerun.
+    """
+    state = st.session_state
+    if state.db_feed is None:
+        state.db_feed = pa.Table.from_pandas(build_display_df(db_views()[0]), preserve_index=False)
+    return state.db_feed
+
+
+FEED_COLUMN_CONFIG = {
+    "Amount": st.column_config.NumberColumn("Amount", format="$%.2f"),
+    "Trust": st.column_config.NumberColumn("Trust", format="%.0f%%"),
+    "Verdict": st.column_config.TextColumn(
+        "Verdict",
+        help="🟢 Approved | 🔴 Denied | 🟡 Escalated (Circuit Breaker)"
+    )
+}
 
 
 # ============================================================================
@@ -96,42 +301,69 @@ def parse_log(log):
     return {"type": "UNKNOWN", "agent": "Unknown", "message": str(log)}
 
 
-def display_logs(logs: list, show_thoughts: bool = True):
-    """Display logs with proper formatting."""
-    for raw_log in logs:
-        log = parse_log(raw_log)
-        log_type = log.get("type", "")
-        agent = log.get("agent", "")
-        message = log.get("message", "")
-        
-        if log_type == "SYSTEM":
-            st.markdown(f'<div class="system-box">🔧 <b>SYSTEM</b>: {message}</div>', unsafe_allow_html=True)
-        
-        elif log_type == "THOUGHT":
-            if show_thoughts:
-                st.markdown(f'<div class="thought-box">💭 <b>{agent}</b> (thinking): {message}</div>', unsafe_allow_html=True)
-        
-        elif log_type == "SPEAK":
-            if agent == "Advocate":
-                with st.chat_message("Advocate", avatar="🧑‍💼"):
-                    st.markdown(message)
-            elif agent == "Risk Officer":
-                with st.chat_message("Risk Officer", avatar="👮"):
-                    st.markdown(message)
-            else:
-                st.write(message)
-        
-        elif log_type == "JUDGE":
-            with st.chat_message("Judge", avatar="⚖️"):
-                st.markdown(f"*{message}*")
-        
-        elif log_type == "VERDICT":
-            with st.chat_message("Judge", avatar="⚖️"):
-                st.markdown(f"**{message}**")
-        
-        else:
-            # Unknown format - just display
-            st.write(message)
+# Speaker -> avatar for public debate lines
+AGENT_AVATARS = {
+    ADVOCATE: "🧑‍💼",
+    RISK_OFFICER: "👮",
+    JUDGE: "⚖️"
+}
+
+
+def speech_block(agent: str, message: str) -> str:
+    """A public statement; blank lines keep the inner Markdown rendering inside the div."""
+    return f'<div class="speak-box">\n\n{AGENT_AVATARS.get(agent, "💬")} **{agent}**: {message}\n\n</div>'
+
+
+def render_log(log: dict, show_thoughts: bool = True) -> str:
+    """One log entry as a Markdown/HTML block ('' if hidden)."""
+    log_type = log.get("type", "")
+    agent = log.get("agent", "")
+    message = log.get("message", "")
+    
+    if log_type == "SYSTEM":
+        return f'<div class="system-box">🔧 <b>SYSTEM</b>: {message}</div>'
+    
+    elif log_type == "THOUGHT":
+        if show_thoughts:
+            return f'<div class="thought-box">💭 <b>{agent}</b> (thinking): {message}</div>'
+        return ""
+    
+    elif log_type == "SPEAK":
+        if agent in AGENT_AVATARS:
+            return speech_block(agent, message)
+        return message
+    
+    elif log_type == "JUDGE":
+        return speech_block(JUDGE, f"*{message}*")
+    
+    elif log_type == "VERDICT":
+        return speech_block(JUDGE, f"**{message}**")
+    
+    # Unknown format - just display
+    return message
+
+
+def display_logs(logs: list, show_thoughts: bool = True, animate: bool = False):
+    """
+    Display logs as one Markdown element instead of one element per entry.
+    With `animate`, entries fade in one after another in the browser.
+    """
+    blocks = [block for raw_log in logs if (block := render_log(parse_log(raw_log), show_thoughts))]
+    if animate:
+        blocks = [
+            f'<div class="fade-in" style="animation-delay: {i * 0.3:.1f}s">\n\n{block}\n\n</div>'
+            for i, block in enumerate(blocks)
+        ]
+    if blocks:
+        st.markdown("\n\n".join(blocks), unsafe_allow_html=True)
+
+
+def display_thoughts(thoughts: list):
+    """Display THOUGHT entries as one Markdown element."""
+    st.markdown("\n\n".join(
+        f'<div class="thought-box">💭 <b>{t.get("agent", "Agent")}</b>: {t.get("message", "")}</div>'
+        for t in thoughts
+    ), unsafe_allow_html=True)
 
 
 # ============================================================================
@@ -201,6 +433,12 @@ with tab1:
         
         st.markdown("---")
         
+        fresh_run = st.checkbox(
+            "🎲 Fresh deliberation",
+            value=False,
+            help="Agents are LLM-driven, so verdicts can vary. Tick to re-run them instead of replaying the cached verdict for these inputs."
+        )
+        
         run_btn = st.button("🚀 RUN TRIBUNAL", type="primary", use_container_width=True)
     
     with col2:
@@ -208,8 +446,10 @@ with tab1:
         
         if run_btn:
             with st.spinner("Activating Multi-Agent Tribunal..."):
-                time.sleep(0.5)
-                result = TribunalBrain.analyze(tx_id, amount, trust, status)
+                if fresh_run:
+                    result = TribunalBrain.analyze_blocking(tx_id, amount, trust, status, allow_fast_path=False)
+                else:
+                    result = analyze_cached(amount, trust, status, tx_id)
             
             # Verdict Banner
             verdict = result["verdict"]
@@ -234,12 +474,11 @@ with tab1:
             with st.expander("🧠 **Show Internal Monologue** (Agent Thoughts)", expanded=True):
                 st.caption("These are the private thoughts of each agent - not visible to other agents during debate")
                 thoughts = [l for l in result["logs"] if l["type"] == "THOUGHT"]
-                for t in thoughts:
-                    st.markdown(f'<div class="thought-box">💭 <b>{t["agent"]}</b>: {t["message"]}</div>', unsafe_allow_html=True)
+                display_thoughts(thoughts)
             
             # Full Debate (Public Statements)
             st.subheader("🗣️ Public Debate")
-            display_logs(result["logs"], show_thoughts=False)
+            display_logs(result["logs"], show_thoughts=False, animate=True)
         
         else:
             st.info("👈 Configure parameters and click **RUN TRIBUNAL** to see the agents debate")
@@ -258,71 +497,47 @@ with tab2:
         if st.button("🔄 Refresh", use_container_width=True):
             st.rerun()
     
-    # Load database
-    transactions = []
-    if os.path.exists(DB_FILE):
-        try:
-            with open(DB_FILE, "r") as f:
-                transactions = json.load(f)
-        except:
-            transactions = []
+    # Load database (only newly appended rows are parsed)
+    transactions = tail_transactions()
     
     if transactions:
         # Metrics
         m1, m2, m3, m4 = st.columns(4)
         
-        total = len(transactions)
-        approved = sum(1 for t in transactions if t.get("verdict") == "APPROVE")
-        denied = sum(1 for t in transactions if t.get("verdict") == "DENY")
-        escalated = sum(1 for t in transactions if t.get("verdict") == "ESCALATE")
-        money_saved = sum(t.get("amount", 0) for t in transactions if t.get("circuit_breaker", False))
+        frame, tx_index, tx_ids = db_views()
+        stats = compute_metrics(frame)
         
-        m1.metric("Total Transactions", total)
-        m2.metric("✅ Approved", approved)
-        m3.metric("🔒 Escalated", escalated)
-        m4.metric("💰 Money Saved", f"${money_saved:,.2f}")
+        m1.metric("Total Transactions", stats["total"])
+        m2.metric("✅ Approved", stats["approved"])
+        m3.metric("🔒 Escalated", stats["escalated"])
+        m4.metric("💰 Money Saved", f"${stats['money_saved']:,.2f}")
         
         st.markdown("---")
         
         # Transaction Table
         st.subheader("📋 Recent Transactions")
         
-        display_data = [{
-            "Time": t.get("timestamp", "")[:19],
-            "TX ID": t.get("transaction_id", ""),
-            "User": t.get("user_id", ""),
-            "Amount": f"${t.get('amount', 0):,.2f}",
-            "Trust": f"{t.get('user_trust', 0):.0%}",
-            "Network": t.get("network_status", ""),
-            "Advocate": t.get("advocate_vote", ""),
-            "Risk": t.get("risk_vote", ""),
-            "Verdict": t.get("verdict", "")
-        } for t in reversed(transactions)]
-        
-        df = pd.DataFrame(display_data)
-        
-        def highlight_verdict(row):
-            v = row["Verdict"]
-            if v == "ESCALATE":
-                return ["background-color: #ffc107; color: black"] * len(row)
-            elif v == "DENY":
-                return ["background-color: #dc3545; color: white"] * len(row)
-            elif v == "APPROVE":
-                return ["background-color: #28a745; color: white"] * len(row)
-            return [""] * len(row)
-        
-        styled_df = df.style.apply(highlight_verdict, axis=1)
-        st.dataframe(styled_df, use_container_width=True, hide_index=True)
+        # The table is only built when shown - Inspector-only reruns skip it
+        if st.toggle("Show feed", value=True, key="show_feed"):
+            st.dataframe(feed_table(), column_config=FEED_COLUMN_CONFIG, use_container_width=True, hide_index=True)
         
         # Transaction Inspector
         st.markdown("---")
         st.subheader("🔍 Transaction Inspector")
         
-        tx_ids = [t.get("transaction_id") for t in reversed(transactions)]
-        selected_tx = st.selectbox("Select Transaction to Inspect", tx_ids)
+        col_pick, col_search = st.columns([2, 1])
+        with col_pick:
+            selected_tx = st.selectbox("Select Transaction to Inspect", tx_ids)
+        with col_search:
+            search_tx = st.text_input("Search TX ID", placeholder="TX-...").strip()
+        if search_tx:
+            if search_tx in tx_index:
+                selected_tx = search_tx
+            else:
+                st.warning(f"No transaction `{search_tx}` in the last {MAX_RECORDS} records.")
         
         if selected_tx:
-            tx = next((t for t in transactions if t.get("transaction_id") == selected_tx), None)
+            tx = tx_index.get(selected_tx)
             if tx:
                 col_a, col_b = st.columns(2)
                 
@@ -344,10 +559,9 @@ with tab2:
                 
                 with st.expander("🧠 **Internal Monologue**", expanded=False):
                     raw_logs = tx.get("logs", [])
-                    thoughts = [parse_log(l) for l in raw_logs if parse_log(l).get("type") == "THOUGHT"]
+                    thoughts = [p for l in raw_logs if (p := parse_log(l)).get("type") == "THOUGHT"]
                     if thoughts:
-                        for t in thoughts:
-                            st.markdown(f'<div class="thought-box">💭 <b>{t.get("agent", "Agent")}</b>: {t.get("message", "")}</div>', unsafe_allow_html=True)
+                        display_thoughts(thoughts)
                     else:
                         st.info("No internal thoughts recorded for this transaction (old format).")
                 
@@ -383,7 +597,7 @@ with st.expander("💡 **How to Present to Judges**"):
     
     1. **Open Tab 1 (Simulation Gym)**
     2. Set Trust to **0.90** (VIP) and Network to **TIMEOUT_504**
-    3. Click **RUN TRIBUNAL**
+    3. Click **RUN TRIBUNAL** (the Gym always runs the full debate, even for a 504)
     4. **Expand "Internal Monologue"**
     
     ### The Pitch
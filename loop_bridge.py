@@ -0,0 +1,35 @@
+"""
+Sentinel: Sync -> Async Bridge
+==============================
+
+Streamlit apps and scripts are synchronous, but the tribunal and the checkout
+talk through pooled httpx.AsyncClients. A pool is bound to the event loop its
+connections were opened on, so a fresh asyncio.run() per request would strand
+those connections (or fail outright when the client hops loops). Instead every
+synchronous caller in the process submits its coroutine to one long-lived
+background loop.
+
+Kept free of the LLM stack so the merchant store can import it cheaply.
+"""
+
+import asyncio
+import threading
+from typing import Any, Coroutine, Optional
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """The process-wide background event loop, started on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, daemon=True).start()
+    return _loop
+
+
+def run_blocking(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run `coro` on the background loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, get_background_loop()).result()
@@ -29,7 +29,7 @@ from rich.markdown import Markdown
 from dotenv import load_dotenv
 load_dotenv()
 
-from models.schemas import Decision, Verdict, TransactionSignal
+from models.schemas import Verdict, TransactionSignal
 from mock_data.scenarios import (
     get_happy_path_scenario,
     get_adversarial_scenario,
@@ -71,8 +71,8 @@ def display_transaction_signal(signal: TransactionSignal):
     table.add_row("Transaction ID", signal.transaction_id)
     table.add_row("User Claim", signal.user_claim[:80] + "..." if len(signal.user_claim) > 80 else signal.user_claim)
     table.add_row("Amount", f"${signal.amount:.2f}")
-    table.add_row("Bank Status", signal.bank_status.value)
-    table.add_row("Ledger Status", signal.ledger_status.value)
+    table.add_row("Bank Status", signal.bank_status)
+    table.add_row("Ledger Status", signal.ledger_status)
     
     console.print(table)
     console.print()
@@ -85,23 +85,23 @@ def display_debate_log(state: dict):
     # Round 1
     console.print("\n[bold yellow]━━━ ROUND 1: Opening Statements ━━━[/bold yellow]")
     for arg in state.get("round_1_arguments", []):
-        style = "green" if arg.position == Decision.REFUND else "red" if arg.position == Decision.DENY else "yellow"
-        console.print(f"  [{style}]{arg.agent_name}[/{style}]: {arg.position.value} ({arg.confidence:.0f}% confidence)")
-        console.print(f"     [dim]{arg.reasoning[:100]}...[/dim]")
+        style = "green" if arg["position"] == "REFUND" else "red" if arg["position"] == "DENY" else "yellow"
+        console.print(f"  [{style}]{arg['agent_name']}[/{style}]: {arg['position']} ({arg['confidence']:.0f}% confidence)")
+        console.print(f"     [dim]{arg['reasoning'][:100]}...[/dim]")
     
     # Round 2
     console.print("\n[bold yellow]━━━ ROUND 2: Challenge & Rebuttal ━━━[/bold yellow]")
     for arg in state.get("round_2_rebuttals", []):
-        style = "green" if arg.position == Decision.REFUND else "red" if arg.position == Decision.DENY else "yellow"
-        console.print(f"  [{style}]{arg.agent_name}[/{style}]: {arg.position.value} ({arg.confidence:.0f}% confidence)")
-        console.print(f"     [dim]{arg.reasoning[:100]}...[/dim]")
+        style = "green" if arg["position"] == "REFUND" else "red" if arg["position"] == "DENY" else "yellow"
+        console.print(f"  [{style}]{arg['agent_name']}[/{style}]: {arg['position']} ({arg['confidence']:.0f}% confidence)")
+        console.print(f"     [dim]{arg['reasoning'][:100]}...[/dim]")
     
     # Round 3
     console.print("\n[bold yellow]━━━ ROUND 3: Final Votes ━━━[/bold yellow]")
     for vote in state.get("round_3_votes", []):
-        style = "green" if vote.vote == Decision.REFUND else "red" if vote.vote == Decision.DENY else "yellow"
-        veto_str = " [bold red]⛔ VETO[/bold red]" if vote.veto_triggered else ""
-        console.print(f"  [{style}]{vote.agent_name}[/{style}]: {vote.vote.value} ({vote.confidence:.0f}%){veto_str}")
+        style = "green" if vote["vote"] == "REFUND" else "red" if vote["vote"] == "DENY" else "yellow"
+        veto_str = " [bold red]⛔ VETO[/bold red]" if vote.get("veto_triggered") else ""
+        console.print(f"  [{style}]{vote['agent_name']}[/{style}]: {vote['vote']} ({vote['confidence']:.0f}%){veto_str}")
     
     console.print()
 
@@ -114,13 +114,13 @@ def display_verdict(verdict: Verdict):
         title = "⚠️  CIRCUIT BREAKER TRIGGERED  ⚠️"
         decision_style = "bold yellow"
         icon = "🔒"
-    elif verdict.decision == Decision.REFUND:
+    elif verdict.decision == "REFUND":
         # REFUND - Green success
         border_style = "bold green"
         title = "✅ VERDICT: REFUND APPROVED"
         decision_style = "bold green"
         icon = "💰"
-    elif verdict.decision == Decision.DENY:
+    elif verdict.decision == "DENY":
         # DENY - Red denial
         border_style = "bold red"
         title = "❌ VERDICT: REFUND DENIED"
@@ -135,7 +135,7 @@ def display_verdict(verdict: Verdict):
     
     # Build verdict content
     content = f"""
-{icon} **Decision**: [{decision_style}]{verdict.decision.value}[/{decision_style}]
+{icon} **Decision**: [{decision_style}]{verdict.decision}[/{decision_style}]
 📊 **Confidence**: {verdict.confidence:.1f}%
 📝 **Reasoning**: {verdict.reasoning}
 """
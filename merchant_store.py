@@ -10,13 +10,21 @@ HOW TO RUN THE COMPLETE SYSTEM:
 Terminal 1: uvicorn api:app --reload
 Terminal 2: streamlit run dashboard.py --server.port 8501
 Terminal 3: streamlit run merchant_store.py --server.port 8502
+
+Set SNEAKERVAULT_DEMO_DELAY=0 to skip the simulated network delay at checkout.
 """
 
 import streamlit as st
-import requests
+import httpx
+import orjson
+import asyncio
+import threading
+import os
 import random
 import time
-from datetime import datetime
+from typing import Optional
+
+from loop_bridge import run_blocking
 
 # ============================================================================
 # PAGE CONFIG
@@ -70,11 +78,7 @@ st.markdown("""
         border-radius: 15px;
         text-align: center;
         font-size: 24px;
-        animation: pulse 2s infinite;
-    }
-    @keyframes pulse {
-        0%, 100% { box-shadow: 0 0 0 0 rgba(255, 193, 7, 0.7); }
-        50% { box-shadow: 0 0 20px 10px rgba(255, 193, 7, 0.3); }
+        border: 2px solid rgba(255, 193, 7, 0.7);
     }
     .result-declined {
         background: linear-gradient(135deg, #dc3545, #c82333);
@@ -89,25 +93,136 @@ st.markdown("""
 
 API_URL = "http://127.0.0.1:8000"
 
+# Network status -> Developer Tools label
+BANK_OPTIONS = {
+    "SUCCESS_200": "✅ SUCCESS_200 (Payment OK)",
+    "TIMEOUT_504": "⚠️ TIMEOUT_504 (Network Hang - The Trap!)",
+    "FAILED_402": "❌ FAILED_402 (Card Declined)"
+}
+
+# Simulated bank latency for the demo - off for benchmarks (toggle also in the sidebar)
+DEMO_DELAY = os.getenv("SNEAKERVAULT_DEMO_DELAY", "1") == "1"
+
+
+# ============================================================================
+# CHECKOUT CLIENT
+# ============================================================================
+
+@st.cache_resource
+def get_checkout_client() -> httpx.AsyncClient:
+    """
+    Pooled client - repeat checkouts reuse the kept-alive connection to the API.
+    HTTP/2 is negotiated when the API is served over TLS (plain http stays on 1.1).
+    """
+    return httpx.AsyncClient(
+        base_url=API_URL,
+        headers={"Content-Type": "application/json"},
+        http2=True,
+        timeout=15,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+    )
+
+
+class ClientCircuitBreaker:
+    """
+    Trips after `fail_threshold` consecutive failed checkouts (connect errors, timeouts),
+    then rejects checkouts for `reset_after` seconds instead of waiting on a dead API.
+    After the cooldown exactly one caller is let through as a probe (half-open);
+    everyone else keeps failing fast until that probe is recorded as ok or failed.
+    """
+    
+    def __init__(self, fail_threshold: int = 3, reset_after: float = 5.0):
+        self.fail_threshold = fail_threshold
+        self.reset_after = reset_after
+        self.fails = 0
+        self.opened_at: Optional[float] = None
+        self.half_open = False
+        self._lock = threading.Lock()
+    
+    def allow(self) -> bool:
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if not self.half_open and time.monotonic() - self.opened_at >= self.reset_after:
+                self.half_open = True  # this caller is the probe
+                return True
+            return False
+    
+    def record_ok(self):
+        with self._lock:
+            self.fails = 0
+            self.opened_at = None
+            self.half_open = False
+    
+    def record_fail(self):
+        with self._lock:
+            self.fails += 1
+            if self.half_open or self.fails >= self.fail_threshold:
+                self.opened_at = time.monotonic()  # (re-)open for another cooldown
+            self.half_open = False
+
+
+@st.cache_resource
+def get_api_breaker() -> ClientCircuitBreaker:
+    """One breaker per process - every session sees the same API health."""
+    return ClientCircuitBreaker()
+
+
+async def submit_payment(client: httpx.AsyncClient, payload: dict, delay: float) -> httpx.Response:
+    """
+    POST the order to the Sentinel webhook.
+    The simulated network delay runs alongside the request instead of before it,
+    so a checkout takes max(delay, round-trip) rather than their sum.
+    """
+    response, _ = await asyncio.gather(
+        client.post("/webhook", content=orjson.dumps(payload)),
+        asyncio.sleep(delay)
+    )
+    return response
+
 
 # ============================================================================
 # SESSION STATE
 # ============================================================================
 
-if "order_result" not in st.session_state:
-    st.session_state.order_result = None
+def new_customer() -> dict:
+    """Fresh session keys for a new simulated shopper."""
+    return {
+        "order_result": None,
+        "user_id": f"cust_{random.randint(10000, 99999)}",
+        "user_trust": round(random.uniform(0.75, 0.95), 2)
+    }
+
+
+def start_new_order():
+    """New Order callback - runs before the rerun the click triggers, so no st.rerun() needed."""
+    st.session_state.update(new_customer())
 
-if "user_id" not in st.session_state:
-    st.session_state.user_id = f"cust_{random.randint(10000, 99999)}"
 
-if "user_trust" not in st.session_state:
-    st.session_state.user_trust = round(random.uniform(0.75, 0.95), 2)
+# Seeded in one batch on the first run - later reruns skip the RNG calls
+if "user_id" not in st.session_state:
+    st.session_state.update(new_customer())
 
 
 # ============================================================================
 # MAIN STORE UI
 # ============================================================================
 
+st.sidebar.checkbox("Simulate network delay", value=DEMO_DELAY, key="demo_delay")
+st.sidebar.checkbox("Demo mode (balloons & pulse)", value=False, key="demo_mode")
+
+# Animations only ship to the browser in demo mode
+if st.session_state.demo_mode:
+    st.markdown("""
+    <style>
+        .result-review { animation: pulse 2s infinite; }
+        @keyframes pulse {
+            0%, 100% { box-shadow: 0 0 0 0 rgba(255, 193, 7, 0.7); }
+            50% { box-shadow: 0 0 20px 10px rgba(255, 193, 7, 0.3); }
+        }
+    </style>
+    """, unsafe_allow_html=True)
+
 # Header
 st.markdown("""
 <div class="store-header">
@@ -149,24 +264,15 @@ with col2:
     with st.expander("🔧 **Developer Tools** (Force Bank Error)", expanded=False):
         st.caption("Simulate different bank responses for demo purposes")
         
-        bank_response = st.selectbox(
+        # The widget returns the status code itself - no label parsing
+        network_status = st.selectbox(
             "Bank Response Override:",
-            [
-                "✅ SUCCESS_200 (Payment OK)",
-                "⚠️ TIMEOUT_504 (Network Hang - The Trap!)",
-                "❌ FAILED_402 (Card Declined)"
-            ],
+            list(BANK_OPTIONS),
+            format_func=BANK_OPTIONS.get,
             index=0
         )
-        
-        # Parse status
-        if "200" in bank_response:
-            network_status = "SUCCESS_200"
-        elif "504" in bank_response:
-            network_status = "TIMEOUT_504"
+        if network_status == "TIMEOUT_504":
             st.error("⚠️ This will trigger the Circuit Breaker!")
-        else:
-            network_status = "FAILED_402"
         
         # Override trust
         override_trust = st.slider(
@@ -184,46 +290,65 @@ with col2:
         st.session_state.order_result = None
         
         # Generate TX ID
-        tx_id = f"TX-{datetime.now().strftime('%H%M%S')}-{random.randint(100, 999)}"
+        # Millisecond clock + random suffix - no strftime, no same-second collisions
+        tx_id = f"TX-{int(time.time() * 1000) % 100_000_000:08d}-{random.randrange(1000):03d}"
         
         # Prepare payload
         payload = {
             "transaction_id": tx_id,
             "amount": 4999.00,
             "user_id": st.session_state.user_id,
-            "user_trust": override_trust if 'override_trust' in dir() else st.session_state.user_trust,
-            "status": network_status if 'network_status' in dir() else "SUCCESS_200"
+            "user_trust": override_trust,
+            "status": network_status
         }
         
-        # Show processing
-        with st.spinner("🔄 Processing payment through Sentinel..."):
-            # Simulate network delay for timeout scenario
-            if "504" in (network_status if 'network_status' in dir() else ""):
-                time.sleep(2.5)
-            else:
-                time.sleep(1.2)
+        # Fail fast while the API is known to be down
+        breaker = get_api_breaker()
+        if not breaker.allow():
+            st.session_state.order_result = {
+                "verdict": "ERROR",
+                "reason": "Sentinel temporarily unavailable - retrying shortly."
+            }
+        else:
+            # Show processing
+            with st.spinner("🔄 Processing payment through Sentinel..."):
+                # Simulate network delay (longer for the timeout scenario)
+                delay = 0.0
+                if st.session_state.demo_delay:
+                    delay = 2.5 if network_status == "TIMEOUT_504" else 1.2
             
-            try:
-                response = requests.post(f"{API_URL}/webhook", json=payload, timeout=15)
+                try:
+                    response = run_blocking(submit_payment(get_checkout_client(), payload, delay))
                 
-                if response.status_code == 200:
-                    st.session_state.order_result = response.json()
-                else:
+                    breaker.record_ok()
+                    if response.status_code == 200:
+                        st.session_state.order_result = orjson.loads(response.content)
+                    else:
+                        st.session_state.order_result = {
+                            "verdict": "ERROR",
+                            "reason": f"API returned status {response.status_code}"
+                        }
+            
+                except (httpx.ConnectError, httpx.ConnectTimeout):
+                    breaker.record_fail()
                     st.session_state.order_result = {
                         "verdict": "ERROR",
-                        "reason": f"API returned status {response.status_code}"
+                        "reason": "Cannot connect to Sentinel API. Is it running?"
+                    }
+                except httpx.TransportError as e:
+                    # Read/write timeouts, dropped connections - a hung API counts as down too
+                    breaker.record_fail()
+                    st.session_state.order_result = {
+                        "verdict": "ERROR",
+                        "reason": f"Sentinel API did not respond ({type(e).__name__})"
+                    }
+                except Exception as e:
+                    # Also releases a half-open probe that failed for any other reason
+                    breaker.record_fail()
+                    st.session_state.order_result = {
+                        "verdict": "ERROR",
+                        "reason": str(e)
                     }
-            
-            except requests.exceptions.ConnectionError:
-                st.session_state.order_result = {
-                    "verdict": "ERROR",
-                    "reason": "Cannot connect to Sentinel API. Is it running?"
-                }
-            except Exception as e:
-                st.session_state.order_result = {
-                    "verdict": "ERROR",
-                    "reason": str(e)
-                }
 
 # Display Result
 if st.session_state.order_result:
@@ -238,7 +363,8 @@ if st.session_state.order_result:
             <span style="font-size: 16px;">Your Air Jordan 1 Retro is on its way! 🎉</span>
         </div>
         """, unsafe_allow_html=True)
-        st.balloons()
+        if st.session_state.demo_mode:
+            st.balloons()
         st.success(f"**Transaction ID:** {result.get('transaction_id', 'N/A')}")
     
     elif verdict == "ESCALATE":
@@ -276,11 +402,7 @@ uvicorn api:app --reload
         """)
     
     # Reset button
-    if st.button("🔄 New Order"):
-        st.session_state.order_result = None
-        st.session_state.user_id = f"cust_{random.randint(10000, 99999)}"
-        st.session_state.user_trust = round(random.uniform(0.75, 0.95), 2)
-        st.rerun()
+    st.button("🔄 New Order", on_click=start_new_order)
 
 # Footer
 st.markdown("---")
@@ -291,8 +413,8 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-# Demo Instructions
-with st.expander("📖 **Demo Instructions**"):
+# Demo Instructions - only parsed and sent while the toggle is on
+if st.toggle("📖 **Demo Instructions**", value=False, key="show_instructions"):
     st.markdown("""
     ### Normal Flow
     1. Click **PAY $4,999** → ✅ Order Confirmed
@@ -3,22 +3,54 @@ from .schemas import (
     BankStatus,
     LedgerStatus,
     Decision,
+    SIGNAL_ANALYST,
+    ADVOCATE,
+    RISK_OFFICER,
+    JUDGE,
+    KNOWN_AGENTS,
     TransactionSignal,
     FactSheet,
     AgentArgument,
     AgentVote,
     DebateLog,
-    Verdict
+    Verdict,
+    RefundVerdict,
+    DenyVerdict,
+    UncertainVerdict,
+    EscalateVerdict,
+    VerdictUnion,
+    VERDICT_VARIANTS,
+    parse_verdict,
+    parse_signal_json,
+    parse_signals_json,
+    parse_signals_jsonl,
+    serialize_verdict
 )
 
 __all__ = [
     "BankStatus",
     "LedgerStatus", 
     "Decision",
+    "SIGNAL_ANALYST",
+    "ADVOCATE",
+    "RISK_OFFICER",
+    "JUDGE",
+    "KNOWN_AGENTS",
     "TransactionSignal",
     "FactSheet",
     "AgentArgument",
     "AgentVote",
     "DebateLog",
-    "Verdict"
+    "Verdict",
+    "RefundVerdict",
+    "DenyVerdict",
+    "UncertainVerdict",
+    "EscalateVerdict",
+    "VerdictUnion",
+    "VERDICT_VARIANTS",
+    "parse_verdict",
+    "parse_signal_json",
+    "parse_signals_json",
+    "parse_signals_jsonl",
+    "serialize_verdict"
 ]
@@ -3,33 +3,33 @@ Pydantic Schemas for Zero-Loss Circuit Breaker.
 Defines the data structures for transaction signals, agent votes, and verdicts.
 """
 
+import sys
 from datetime import datetime
-from enum import Enum
-from typing import Literal, Optional, List
-from pydantic import BaseModel, Field
+import orjson
+from typing import Annotated, Iterator, Literal, Optional, List, Union
+from typing_extensions import NotRequired, TypedDict  # pydantic needs this TypedDict before 3.12
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, TypeAdapter
 
 
-class BankStatus(str, Enum):
-    """Possible states from the Bank API."""
-    SUCCESS = "SUCCESS"
-    FAILED = "FAILED"
-    TIMEOUT_504 = "TIMEOUT_504"
-    PENDING = "PENDING"
+# Status/decision types are plain string Literals: values compare as str, no .value needed
 
+BankStatus = Literal["SUCCESS", "FAILED", "TIMEOUT_504", "PENDING"]
+"""Possible states from the Bank API."""
 
-class LedgerStatus(str, Enum):
-    """Possible states from the internal Ledger."""
-    FOUND = "FOUND"
-    NOT_FOUND = "NOT_FOUND"
-    PENDING = "PENDING"
+LedgerStatus = Literal["FOUND", "NOT_FOUND", "PENDING"]
+"""Possible states from the internal Ledger."""
 
+Decision = Literal["REFUND", "DENY", "UNCERTAIN", "ESCALATE"]
+"""Possible agent/system decisions."""
 
-class Decision(str, Enum):
-    """Possible agent/system decisions."""
-    REFUND = "REFUND"
-    DENY = "DENY"
-    UNCERTAIN = "UNCERTAIN"
-    ESCALATE = "ESCALATE"
+
+# The tribunal's fixed cast. Names are interned so grouping/comparing by agent is an identity check
+SIGNAL_ANALYST = sys.intern("Signal Analyst")
+ADVOCATE = sys.intern("Advocate")
+RISK_OFFICER = sys.intern("Risk Officer")
+JUDGE = sys.intern("Judge")
+KNOWN_AGENTS = (SIGNAL_ANALYST, ADVOCATE, RISK_OFFICER, JUDGE)
+AgentName = Annotated[str, AfterValidator(sys.intern)]
 
 
 class TransactionSignal(BaseModel):
@@ -44,8 +44,10 @@ class TransactionSignal(BaseModel):
     amount: float = Field(..., description="Transaction amount in currency")
     timestamp: datetime = Field(default_factory=datetime.now, description="When the dispute was raised")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        # Instances handed between agents are never re-validated (e.g. FactSheet.raw_signals)
+        revalidate_instances="never",
+        json_schema_extra={
             "example": {
                 "transaction_id": "TXN-12345",
                 "user_claim": "I was charged but never received my product!",
@@ -55,9 +57,26 @@ class TransactionSignal(BaseModel):
                 "timestamp": "2026-02-06T12:00:00"
             }
         }
+    )
+
+
+class InternalModel(BaseModel):
+    """
+    Base for models produced by our own agents, never by outside callers.
+    Inputs from the outside world (TransactionSignal) always go through full validation.
+    """
+    model_config = ConfigDict(revalidate_instances="never")
+    
+    @classmethod
+    def trusted(cls, **data):
+        """
+        Build without validation - for data our own code already typed.
+        Field defaults still apply; values are NOT coerced or range-checked.
+        """
+        return cls.model_construct(**data)
 
 
-class FactSheet(BaseModel):
+class FactSheet(InternalModel):
     """
     Objective facts extracted by the Signal Analyst.
     No opinions, just raw truth from the data sources.
@@ -70,29 +89,30 @@ class FactSheet(BaseModel):
     raw_signals: TransactionSignal
 
 
-class AgentArgument(BaseModel):
+class AgentArgument(TypedDict):
     """
     An argument made by an agent during the debate.
+    A plain dict - only ever read back through its DebateLog, so no model per argument.
     """
-    agent_name: str
+    agent_name: AgentName
     position: Decision
-    reasoning: str = Field(..., description="The logical argument supporting the position")
-    evidence: List[str] = Field(default_factory=list, description="Key facts cited")
-    confidence: float = Field(..., ge=0, le=100, description="Confidence score 0-100")
+    reasoning: str  # The logical argument supporting the position
+    evidence: NotRequired[List[str]]  # Key facts cited
+    confidence: Annotated[float, Field(ge=0, le=100)]  # Confidence score 0-100
 
 
-class AgentVote(BaseModel):
+class AgentVote(TypedDict):
     """
     The final vote submitted by an agent after the debate rounds.
     """
-    agent_name: str
+    agent_name: AgentName
     vote: Decision
-    confidence: float = Field(..., ge=0, le=100)
+    confidence: Annotated[float, Field(ge=0, le=100)]
     final_reasoning: str
-    veto_triggered: bool = Field(default=False, description="If True, this agent is blocking the action")
+    veto_triggered: NotRequired[bool]  # If True, this agent is blocking the action
 
 
-class DebateLog(BaseModel):
+class DebateLog(InternalModel):
     """
     Complete record of the multi-round debate between agents.
     """
@@ -101,9 +121,11 @@ class DebateLog(BaseModel):
     round_3_votes: List[AgentVote] = Field(default_factory=list)
 
 
-class Verdict(BaseModel):
+class Verdict(InternalModel):
     """
     The final output of the Zero-Loss Circuit Breaker system.
+    Build verdicts with parse_verdict() or Verdict.trusted() to get the decision-specific
+    variant; calling Verdict(...) directly is not variant-aware and returns the base class.
     """
     transaction_id: str
     decision: Decision
@@ -113,8 +135,12 @@ class Verdict(BaseModel):
     escalation_reason: Optional[str] = None
     debate_summary: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        # Emitted once, then only read: immutable (hashable), no extras, schema built on first use
+        frozen=True,
+        extra="forbid",
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "transaction_id": "TXN-12345",
                 "decision": "ESCALATE",
@@ -125,3 +151,88 @@ class Verdict(BaseModel):
                 "debate_summary": "Advocate argued for refund (65% conf), Risk Officer vetoed (85% risk conf)"
             }
         }
+    )
+    
+    @classmethod
+    def trusted(cls, **data):
+        """
+        Build without validation, as the decision-specific variant (EscalateVerdict, ...)
+        so type-based dispatch sees trusted verdicts the same as parsed ones.
+        """
+        if cls is Verdict:
+            cls = VERDICT_VARIANTS.get(data.get("decision"), Verdict)
+        return cls.model_construct(**data)
+
+
+class RefundVerdict(Verdict):
+    """Verdict variant for decision == "REFUND"."""
+    decision: Literal["REFUND"] = "REFUND"
+
+
+class DenyVerdict(Verdict):
+    """Verdict variant for decision == "DENY"."""
+    decision: Literal["DENY"] = "DENY"
+
+
+class UncertainVerdict(Verdict):
+    """Verdict variant for decision == "UNCERTAIN"."""
+    decision: Literal["UNCERTAIN"] = "UNCERTAIN"
+
+
+class EscalateVerdict(Verdict):
+    """Verdict variant for decision == "ESCALATE"."""
+    decision: Literal["ESCALATE"] = "ESCALATE"
+
+
+# Tagged union - validation picks the variant with one lookup on `decision`,
+# and handlers can dispatch on type (isinstance / match) instead of re-checking it.
+# Only parse_verdict() and Verdict.trusted() return these variants - Verdict(...) does not.
+VerdictUnion = Annotated[
+    Union[RefundVerdict, DenyVerdict, UncertainVerdict, EscalateVerdict],
+    Field(discriminator="decision")
+]
+
+VERDICT_VARIANTS = {
+    "REFUND": RefundVerdict,
+    "DENY": DenyVerdict,
+    "UNCERTAIN": UncertainVerdict,
+    "ESCALATE": EscalateVerdict
+}
+
+
+# ============================================================================
+# JSON INGRESS / EGRESS
+# ============================================================================
+
+# Validator for signal batches, compiled once at import
+_SIGNALS_ADAPTER = TypeAdapter(List[TransactionSignal])
+# Verdict variants keep Verdict's defer_build - their validator is compiled on first parse
+_VERDICT_ADAPTER = TypeAdapter(VerdictUnion, config=ConfigDict(defer_build=True))
+
+
+def parse_signal_json(data: bytes) -> TransactionSignal:
+    """Validate a raw JSON signal in one pass (no json.loads -> dict -> model hop)."""
+    return TransactionSignal.model_validate_json(data)
+
+
+def parse_signals_json(data: bytes) -> List[TransactionSignal]:
+    """Validate a raw JSON array of signals in one pass."""
+    return _SIGNALS_ADAPTER.validate_json(data)
+
+
+def parse_signals_jsonl(path: str) -> Iterator[TransactionSignal]:
+    """Stream signals from a JSON-lines file, validating each raw line (blank lines skipped)."""
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield TransactionSignal.model_validate_json(line)
+
+
+def parse_verdict(data: dict) -> Verdict:
+    """Validate a verdict dict into its decision-specific Verdict subclass."""
+    return _VERDICT_ADAPTER.validate_python(data)
+
+
+def serialize_verdict(verdict: Verdict) -> bytes:
+    """Verdict as JSON bytes via orjson (naive datetimes are written as UTC)."""
+    return orjson.dumps(verdict.model_dump(), option=orjson.OPT_NAIVE_UTC)
@@ -0,0 +1,66 @@
+"""
+Sentinel: Transaction DB Tests
+==============================
+
+Checks the append-only NDJSON store in api.py (appends, compaction, recovery).
+
+Run with `pytest test_api.py`.
+"""
+
+import orjson
+import pytest
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """api module pointed at a scratch DB that compacts to 3 records at 6 lines."""
+    import api
+    monkeypatch.setattr(api, "DB_FILE", str(tmp_path / "transactions_db.jsonl"))
+    monkeypatch.setattr(api, "MAX_RECORDS", 3)
+    monkeypatch.setattr(api, "COMPACT_AT", 6)
+    monkeypatch.setattr(api, "_db_lines", None)
+    return api
+
+
+def read_lines(api) -> list:
+    with open(api.DB_FILE, "rb") as f:
+        return f.read().splitlines()
+
+
+def test_append_writes_one_line_per_record(db):
+    for i in range(3):
+        db.append_transaction({"transaction_id": f"TX-{i}"})
+
+    assert [orjson.loads(line)["transaction_id"] for line in read_lines(db)] == ["TX-0", "TX-1", "TX-2"]
+    assert db._db_lines == 3
+
+
+def test_compaction_keeps_last_max_records(db):
+    for i in range(7):
+        db.append_transaction({"transaction_id": f"TX-{i}"})
+
+    # The 7th append crosses COMPACT_AT and rewrites the file to the newest MAX_RECORDS
+    assert [orjson.loads(line)["transaction_id"] for line in read_lines(db)] == ["TX-4", "TX-5", "TX-6"]
+    assert db._db_lines == 3
+
+
+def test_torn_last_line_does_not_swallow_next_record(db):
+    with open(db.DB_FILE, "wb") as f:
+        f.write(b'{"transaction_id":"TX-0"}\n{"transaction_id":"TX-')
+
+    db.append_transaction({"transaction_id": "TX-2"})
+
+    assert read_lines(db)[-1] == b'{"transaction_id":"TX-2"}'
+    assert db._db_lines == 3
+    assert [t["transaction_id"] for t in db.load_db()] == ["TX-0", "TX-2"]
+
+
+def test_load_db_skips_corrupt_lines(db):
+    with open(db.DB_FILE, "wb") as f:
+        f.write(b'{"transaction_id":"TX-0"}\nnot json\n\n{"transaction_id":"TX-1"}\n')
+
+    assert [t["transaction_id"] for t in db.load_db()] == ["TX-0", "TX-1"]
+
+
+def test_load_db_missing_file(db):
+    assert db.load_db() == []
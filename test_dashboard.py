@@ -0,0 +1,50 @@
+"""
+Sentinel: Dashboard Tests
+=========================
+
+Renders dashboard.py headlessly (Streamlit AppTest) against a scratch transactions DB.
+
+Run with `pytest test_dashboard.py`.
+"""
+
+import os
+
+import orjson
+import pytest
+
+AppTest = pytest.importorskip("streamlit.testing.v1").AppTest
+
+DASHBOARD = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dashboard.py")
+
+
+def record(tx_id: str, verdict: str) -> dict:
+    return {
+        "transaction_id": tx_id,
+        "user_id": "cust_1",
+        "amount": 100.0,
+        "user_trust": 0.5,
+        "network_status": "SUCCESS_200",
+        "verdict": verdict,
+        "reason": "",
+        "risk_score": 0,
+        "circuit_breaker": False,
+        "advocate_vote": "APPROVE",
+        "risk_vote": "APPROVE",
+        "logs": [],
+        "timestamp": "2026-02-07T13:18:52"
+    }
+
+
+@pytest.mark.parametrize("verdict", ["", "UNCERTAIN"])
+def test_escalation_desk_renders_odd_verdicts(tmp_path, monkeypatch, verdict):
+    # An empty or unexpected Judge verdict must not take the Recent Transactions table down
+    monkeypatch.chdir(tmp_path)
+    lines = [record("TX-1", "APPROVE"), record("TX-2", verdict)]
+    (tmp_path / "transactions_db.jsonl").write_bytes(b"".join(orjson.dumps(r) + b"\n" for r in lines))
+
+    at = AppTest.from_file(DASHBOARD, default_timeout=60).run()
+
+    assert not at.exception
+    table = at.dataframe[0].value
+    assert list(table["TX ID"]) == ["TX-2", "TX-1"]
+    assert list(table["Verdict"]) == [verdict, "🟢 APPROVE"]
@@ -0,0 +1,100 @@
+"""
+Sentinel: Schema Tests
+======================
+
+Checks the JSON ingress/egress helpers and Verdict construction in models.schemas.
+
+Run with `pytest test_models.py`.
+"""
+
+import orjson
+import pytest
+from pydantic import ValidationError
+
+from models import (
+    EscalateVerdict,
+    RefundVerdict,
+    TransactionSignal,
+    Verdict,
+    parse_signal_json,
+    parse_signals_json,
+    parse_signals_jsonl,
+    parse_verdict,
+    serialize_verdict,
+)
+
+SIGNAL = {
+    "transaction_id": "TXN-1",
+    "user_claim": "Charged twice",
+    "bank_status": "TIMEOUT_504",
+    "ledger_status": "NOT_FOUND",
+    "amount": 99.99,
+    "timestamp": "2026-02-06T12:00:00"
+}
+
+VERDICT = {
+    "transaction_id": "TXN-1",
+    "decision": "ESCALATE",
+    "confidence": 45.0,
+    "reasoning": "Funds in limbo",
+    "circuit_breaker_triggered": True
+}
+
+
+def test_parse_signal_json():
+    signal = parse_signal_json(orjson.dumps(SIGNAL))
+    assert signal.transaction_id == "TXN-1"
+    assert signal.bank_status == "TIMEOUT_504"
+
+
+def test_parse_signals_json():
+    signals = parse_signals_json(orjson.dumps([SIGNAL, {**SIGNAL, "transaction_id": "TXN-2"}]))
+    assert [s.transaction_id for s in signals] == ["TXN-1", "TXN-2"]
+
+
+def test_parse_signal_json_rejects_bad_bank_status():
+    bad = orjson.dumps({**SIGNAL, "bank_status": "TEAPOT_418"})
+    with pytest.raises(ValidationError):
+        parse_signal_json(bad)
+    with pytest.raises(ValidationError):
+        parse_signals_json(b"[" + bad + b"]")
+
+
+def test_parse_signals_jsonl_skips_blank_lines(tmp_path):
+    line = TransactionSignal(**SIGNAL).model_dump_json()
+    path = tmp_path / "signals.jsonl"
+    path.write_text(f"{line}\n\n   \n{line}\n\n")
+
+    signals = list(parse_signals_jsonl(str(path)))
+
+    assert len(signals) == 2
+    assert all(s.bank_status == "TIMEOUT_504" for s in signals)
+
+
+def test_serialize_verdict_matches_pydantic():
+    v = parse_verdict(VERDICT)
+    assert serialize_verdict(v) == v.model_dump_json().encode()
+
+
+def test_parse_verdict_picks_variant():
+    assert isinstance(parse_verdict(VERDICT), EscalateVerdict)
+    assert isinstance(parse_verdict({**VERDICT, "decision": "REFUND"}), RefundVerdict)
+
+
+def test_parse_verdict_rejects_unknown_decision():
+    with pytest.raises(ValidationError):
+        parse_verdict({**VERDICT, "decision": "APPROVE"})
+
+
+def test_trusted_applies_defaults_and_variant():
+    v = Verdict.trusted(transaction_id="TXN-1", decision="ESCALATE", confidence=45.0, reasoning="r")
+
+    assert isinstance(v, EscalateVerdict)
+    assert v.circuit_breaker_triggered is False
+    assert v.escalation_reason is None
+    assert v.debate_summary is None
+
+
+def test_direct_construction_is_not_variant_aware():
+    # Documented: only parse_verdict() / trusted() pick the variant
+    assert type(Verdict(**VERDICT)) is Verdict
@@ -7,32 +7,34 @@ Tests the 3 core scenarios:
 1. Happy Path (VIP User + Success) -> APPROVE
 2. Fraud Attack (Low Trust + Failure) -> DENY
 3. Timeout Trap (VIP User + Timeout) -> ESCALATE (Circuit Breaker)
+
+Run with `pytest test_tribunal.py` or as a script: `python test_tribunal.py`.
 """
 
 import sys
 import os
-from dotenv import load_dotenv
-
-# Ensure we can import from root
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import asyncio
+import pytest
 
-from core_logic import TribunalBrain
+from loop_bridge import run_blocking
 
-# Load environment variables
-load_dotenv()
+# The tribunal (LLM client, graph, pydantic models) is imported on first use, not at import time
 
-def run_test(name, inputs, expected_verdict):
+async def run_test(name, inputs, expected_verdict):
+    from core_logic import TribunalBrain
+    
     print(f"\n{'='*60}")
     print(f"TEST: {name}")
     print(f"INPUTS: {inputs}")
     print(f"{'='*60}")
     
     try:
-        result = TribunalBrain.analyze(
+        result = await TribunalBrain.analyze(
             transaction_id="TEST-TX",
             amount=inputs["amount"],
             user_trust=inputs["user_trust"],
-            network_status=inputs["network_status"]
+            network_status=inputs["network_status"],
+            allow_fast_path=False  # exercise the agents, not the fast-path table
         )
         
         verdict = result["verdict"]
@@ -52,33 +54,118 @@ def run_test(name, inputs, expected_verdict):
         print(f"❌ ERROR: {e}")
         return False
 
-if __name__ == "__main__":
-    print("\n🛡️ RUNNING SENTINEL TEST SUITE\n")
-    
+# Test name -> (inputs, expected verdict)
+SCENARIOS = {
     # Test 1: Happy Path
-    t1 = run_test(
-        "Happy Path (VIP Customer)",
+    "Happy Path (VIP Customer)": (
         {"amount": 5000, "user_trust": 0.9, "network_status": "SUCCESS_200"},
         "APPROVE"
-    )
-    
+    ),
     # Test 2: Simple Fraud
-    t2 = run_test(
-        "Simple Fraud (Low Trust + Bad Bank Reg)",
+    "Simple Fraud (Low Trust + Bad Bank Reg)": (
         {"amount": 5000, "user_trust": 0.1, "network_status": "FAILED_402"},
         "DENY"
-    )
-    
+    ),
     # Test 3: The Timeout Trap (Circuit Breaker)
-    t3 = run_test(
-        "The Timeout Trap (Ambiguous State)",
+    "The Timeout Trap (Ambiguous State)": (
         {"amount": 5000, "user_trust": 0.9, "network_status": "TIMEOUT_504"},
         "ESCALATE"
     )
+}
+
+@pytest.fixture(scope="session")
+def tribunal():
+    """Import the tribunal once for the whole session."""
+    import core_logic
+    return core_logic
+
+
+@pytest.mark.parametrize(
+    ("name", "inputs", "expected"),
+    [(name, inputs, expected) for name, (inputs, expected) in SCENARIOS.items()],
+    ids=list(SCENARIOS)
+)
+def test_scenario(tribunal, name, inputs, expected):
+    # Offline the debate fails safe to ESCALATE, so only that case is meaningful without a key
+    if tribunal.llm is None and expected != "ESCALATE":
+        pytest.skip("needs OPENAI_API_KEY")
+    assert run_blocking(run_test(name, inputs, expected))
+
+
+@pytest.mark.parametrize(
+    ("user_trust", "bucket"),
+    [(0.0, "low"), (0.3, "low"), (0.31, "mid"), (0.79, "mid"), (0.8, "high"), (1.0, "high")]
+)
+def test_trust_bucket_boundaries(tribunal, user_trust, bucket):
+    assert tribunal.trust_bucket(user_trust) == bucket
+
+
+@pytest.mark.parametrize(
+    ("user_trust", "network_status", "verdict"),
+    [
+        (0.9, "SUCCESS_200", "APPROVE"),
+        (0.75, "SUCCESS_200", None),  # below the Advocate's VIP line - must be debated
+        (0.1, "FAILED_402", "DENY"),
+        (0.5, "FAILED_402", None),
+        (0.1, "TIMEOUT_504", "ESCALATE"),
+        (0.9, "TIMEOUT_504", "ESCALATE")
+    ]
+)
+def test_fast_path_table(tribunal, monkeypatch, user_trust, network_status, verdict):
+    monkeypatch.setattr(tribunal, "FAST_PATH_ENABLED", True)
+    shortcut = tribunal.fast_path(user_trust, network_status)
+    assert (shortcut[0] if shortcut else None) == verdict
+
+
+def test_fast_path_disabled(tribunal, monkeypatch):
+    monkeypatch.setattr(tribunal, "FAST_PATH_ENABLED", False)
+    assert tribunal.fast_path(0.9, "TIMEOUT_504") is None
+
+
+def test_analyze_fast_path_override(tribunal, monkeypatch):
+    monkeypatch.setattr(tribunal, "FAST_PATH_ENABLED", True)
+    brain = tribunal.TribunalBrain
+
+    skipped = brain.analyze_blocking("TEST-TX", 5000, 0.9, "TIMEOUT_504")
+    assert skipped["advocate_vote"] == "SKIPPED"
+
+    # Demos opt out per call and must get the agents' THOUGHT logs back
+    debated = brain.analyze_blocking("TEST-TX", 5000, 0.9, "TIMEOUT_504", allow_fast_path=False)
+    assert debated["advocate_vote"] != "SKIPPED"
+    assert any(log["type"] == "THOUGHT" for log in debated["logs"])
+
+
+@pytest.mark.parametrize(("value", "enabled"), [(None, True), ("1", True), ("0", False)])
+def test_fast_path_env_toggle(tribunal, monkeypatch, value, enabled):
+    if value is None:
+        monkeypatch.delenv("SENTINEL_FAST_PATH", raising=False)
+    else:
+        monkeypatch.setenv("SENTINEL_FAST_PATH", value)
+    assert tribunal.fast_path_enabled_from_env() is enabled
+
+
+async def main():
+    print("\n🛡️ RUNNING SENTINEL TEST SUITE\n")
+    
+    results = [
+        await run_test(name, inputs, expected)
+        for name, (inputs, expected) in SCENARIOS.items()
+    ]
     
     print("\n" + "="*60)
-    if t1 and t2 and t3:
+    if all(results):
         print("🎉 ALL SYSTEMS GO: SENTINEL IS READY")
     else:
         print("⚠️ SOME TESTS FAILED")
     print("="*60 + "\n")
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+    
+    # Ensure we can import from root
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    
+    # Load environment variables
+    load_dotenv()
+    
+    asyncio.run(main())